@@ -2,56 +2,67 @@
 """
 Advent of Code 2025 - Day 01
 """
+import numpy as np
 
-def part1(data):
-    """Count how many times dial points at 0"""
-    lines = data.strip().split('\n')
-    position = 50
-    count = 0
+START_POSITION = 50
+DIAL_SIZE = 100
+
+
+def parse_rotations(data):
+    """Parse rotations (bytes, or str) into (is_left, distance) arrays"""
+    if isinstance(data, str):
+        data = data.encode()
+    # Binary reads keep Windows line endings, and a '\r' after the digits
+    # would add one to every digit's place value
+    buf = np.frombuffer(data.replace(b'\r\n', b'\n').strip(), dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord(b'\n'))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, buf.size)
 
-    for line in lines:
-        direction = line[0]
-        distance = int(line[1:])
+    is_left = buf[starts] == ord(b'L')
 
-        if direction == 'L':
-            position = (position - distance) % 100
-        else:  # 'R'
-            position = (position + distance) % 100
+    # Each digit's place value is the number of bytes after it on its line
+    line_ends = np.repeat(ends, ends - starts + 1)[:buf.size]
+    places = line_ends - np.arange(buf.size) - 1
+    is_digit = (buf >= ord(b'0')) & (buf <= ord(b'9'))
+    digits = np.where(is_digit, buf - ord(b'0'), 0).astype(np.int64)
+    weighted = digits * 10 ** np.where(is_digit, places, 0)
 
-        if position == 0:
-            count += 1
+    # Summing each line's weighted digits gives its distance
+    distances = np.add.reduceat(weighted, starts)
+    return is_left, distances
+
+
+def dial_positions(is_left, distances):
+    """Position of the dial after each rotation"""
+    deltas = np.where(is_left, -distances, distances)
+    return (START_POSITION + np.cumsum(deltas)) % DIAL_SIZE
+
+
+def part1(data):
+    """Count how many times dial points at 0"""
+    is_left, distances = parse_rotations(data)
+    positions = dial_positions(is_left, distances)
+    return int(np.count_nonzero(positions == 0))
 
-    return count
 
 def part2(data):
     """Count how many times dial points at 0 during any click"""
-    lines = data.strip().split('\n')
-    position = 50
-    count = 0
-
-    for line in lines:
-        direction = line[0]
-        distance = int(line[1:])
-
-        # Count how many times we pass through 0 during this rotation
-        if direction == 'R':
-            count += (position + distance) // 100
-        else:  # 'L'
-            if position == 0:
-                count += distance // 100
-            else:
-                count += (distance - position + 100) // 100
-
-        # Update position
-        if direction == 'L':
-            position = (position - distance) % 100
-        else:  # 'R'
-            position = (position + distance) % 100
-
-    return count
+    is_left, distances = parse_rotations(data)
+    positions = dial_positions(is_left, distances)
+
+    # Position before each rotation
+    before = np.concatenate(([START_POSITION], positions[:-1]))
+
+    # Turning left from p passes 0 as often as turning right from the
+    # mirrored position (100 - p) % 100, so both directions share the
+    # right-turn formula (position + distance) // 100
+    effective_start = np.where(is_left, (DIAL_SIZE - before) % DIAL_SIZE, before)
+    return int(((effective_start + distances) // DIAL_SIZE).sum())
+
 
 if __name__ == "__main__":
-    with open('day01.dat', 'r', encoding='utf-8') as f:
+    with open('day01.dat', 'rb') as f:
         input_data = f.read().strip()
 
     print(f"Part 1: {part1(input_data)}")
@@ -7,51 +7,82 @@ consisting of some sequence of digits repeated exactly twice.
 Examples: 55 (5 twice), 6464 (64 twice), 123123 (123 twice)
 """
 
+# Longest ID (in digits) the lookup tables below cover; longer IDs have
+# their multipliers computed on the fly
+MAX_ID_DIGITS = 20
 
-def is_invalid_id_part1(num):
+POW10 = [10 ** i for i in range(MAX_ID_DIGITS + 1)]
+
+# Multiplying a k-digit pattern by REPEAT_MULTIPLIER[(k, r)] writes it out
+# r times in a row, e.g. 64 * REPEAT_MULTIPLIER[(2, 3)] = 64 * 10101 = 646464
+REPEAT_MULTIPLIER = {
+    (pattern_len, repetitions): sum(POW10[pattern_len * i] for i in range(repetitions))
+    for pattern_len in range(1, MAX_ID_DIGITS // 2 + 1)
+    for repetitions in range(2, MAX_ID_DIGITS // pattern_len + 1)
+}
+
+
+def parse_ranges(data):
     """
-    Check if a number is an invalid ID (pattern repeated exactly twice).
+    Parse comma-separated ID ranges.
 
     Args:
-        num: Integer to check
+        data: Bytes (or string) containing comma-separated ranges
+            (e.g., b"11-22,95-115")
 
     Returns:
-        True if the number is made of a pattern repeated exactly twice
+        List of (start, end) tuples
     """
-    s = str(num)
-
-    # Must have even length to be repeated twice
-    if len(s) % 2 != 0:
-        return False
+    if isinstance(data, str):
+        data = data.encode()
 
-    # Split in half and check if both halves are identical
-    half = len(s) // 2
-    return s[:half] == s[half:]
+    ranges = []
+    for range_str in data.strip().split(b','):
+        start, end = map(int, range_str.split(b'-'))
+        ranges.append((start, end))
+    return ranges
 
 
-def is_invalid_id_part2(num):
+def repeated_ids(start, end, max_repetitions):
     """
-    Check if a number is an invalid ID (pattern repeated at least twice).
+    Find all IDs in a range made of a pattern repeated several times.
+
+    Rather than testing every number in the range, each pattern length and
+    repetition count is turned into a multiplier and only the patterns whose
+    repeated form lands inside the range are generated.
 
     Args:
-        num: Integer to check
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+        max_repetitions: Largest number of repetitions to consider (at least 2)
 
     Returns:
-        True if the number is made of a pattern repeated at least twice
+        Set of IDs in [start, end] made of a pattern repeated between
+        2 and max_repetitions times
     """
-    s = str(num)
-    n = len(s)
-
-    # Try all possible pattern lengths from 1 to n/2
-    for pattern_len in range(1, n // 2 + 1):
-        # Check if n is divisible by pattern_len (so pattern repeats evenly)
-        if n % pattern_len == 0:
-            pattern = s[:pattern_len]
-            repetitions = n // pattern_len
-            # repetitions will automatically be >= 2 since pattern_len <= n/2
-            if pattern * repetitions == s:
-                return True
-    return False
+    ids = set()
+    for total_len in range(len(str(start)), len(str(end)) + 1):
+        for pattern_len in range(1, total_len // 2 + 1):
+            repetitions = total_len // pattern_len
+            if total_len % pattern_len != 0 or repetitions > max_repetitions:
+                continue
+
+            key = (pattern_len, repetitions)
+            if key in REPEAT_MULTIPLIER:
+                multiplier = REPEAT_MULTIPLIER[key]
+                smallest, largest = POW10[pattern_len - 1], POW10[pattern_len] - 1
+            else:
+                # Beyond the tables, so compute what they would hold
+                multiplier = sum(10 ** (pattern_len * i) for i in range(repetitions))
+                smallest, largest = 10 ** (pattern_len - 1), 10 ** pattern_len - 1
+
+            # Patterns must have exactly pattern_len digits (no leading zero)
+            # and produce a repeated ID inside the range
+            lowest = max(smallest, -(-start // multiplier))
+            highest = min(largest, end // multiplier)
+            ids.update(pattern * multiplier
+                       for pattern in range(lowest, highest + 1))
+    return ids
 
 
 def part1(data):
@@ -59,25 +90,14 @@ def part1(data):
     Find sum of all invalid IDs in the given ranges.
 
     Args:
-        data: String containing comma-separated ranges (e.g., "11-22,95-115")
+        data: Bytes (or string) containing comma-separated ranges
+            (e.g., b"11-22,95-115")
 
     Returns:
         Sum of all invalid IDs found in the ranges
     """
-    # Parse comma-separated ranges
-    ranges = []
-    for range_str in data.strip().split(','):
-        start, end = map(int, range_str.split('-'))
-        ranges.append((start, end))
-
-    # Find all invalid IDs and sum them
-    total = 0
-    for start, end in ranges:
-        for num in range(start, end + 1):
-            if is_invalid_id_part1(num):
-                total += num
-
-    return total
+    return sum(sum(repeated_ids(start, end, 2))
+               for start, end in parse_ranges(data))
 
 
 def part2(data):
@@ -85,29 +105,19 @@ def part2(data):
     Find sum of all invalid IDs (repeated at least twice) in the given ranges.
 
     Args:
-        data: String containing comma-separated ranges (e.g., "11-22,95-115")
+        data: Bytes (or string) containing comma-separated ranges
+            (e.g., b"11-22,95-115")
 
     Returns:
         Sum of all invalid IDs found in the ranges
     """
-    # Parse comma-separated ranges
-    ranges = []
-    for range_str in data.strip().split(','):
-        start, end = map(int, range_str.split('-'))
-        ranges.append((start, end))
-
-    # Find all invalid IDs and sum them
-    total = 0
-    for start, end in ranges:
-        for num in range(start, end + 1):
-            if is_invalid_id_part2(num):
-                total += num
-
-    return total
+    # An ID can never repeat a pattern more times than it has digits
+    return sum(sum(repeated_ids(start, end, len(str(end))))
+               for start, end in parse_ranges(data))
 
 
 if __name__ == "__main__":
-    with open('day02.dat', 'r', encoding='utf-8') as f:
+    with open('day02.dat', 'rb') as f:
         input_data = f.read().strip()
 
     print(f"Part 1: {part1(input_data)}")
@@ -6,29 +6,46 @@ Calculate maximum joltage from battery banks. Each bank requires selecting
 exactly two batteries to form a two-digit joltage value. Find the maximum
 possible joltage from each bank and sum them.
 """
+import numpy as np
 
+ZERO = ord('0')
+# Pads short banks; sorts just below '0' so it never wins a maximum
+PADDING = b'/'
 
-def find_max_joltage(bank):
+
+def find_max_joltages(banks):
     """
-    Find the maximum two-digit joltage from a battery bank.
+    Find the maximum two-digit joltage of every battery bank at once.
 
     Strategy:
-    - Try all pairs (i, j) where i < j
-    - Calculate joltage as: digit[i] * 10 + digit[j]
-    - Return the maximum value found
+    - Stack the banks into one 2D array, padding shorter banks with a
+      sentinel that sorts below every digit
+    - A running maximum from the right gives, for each battery, the largest
+      digit at or after it
+    - Each digit paired with the largest digit to its right is a candidate
+      joltage: digit[i] * 10 + max(digit[i+1:])
+    - Return the maximum candidate of each bank
 
     Args:
-        bank: String of digits representing battery joltage ratings
+        banks: List of bytes of ASCII digits representing battery joltage ratings
 
     Returns:
-        Maximum two-digit joltage possible from the bank
+        Array holding the maximum two-digit joltage possible from each bank
     """
-    max_joltage = 0
-    for i, digit_i in enumerate(bank):
-        for j in range(i + 1, len(bank)):
-            joltage = int(digit_i) * 10 + int(bank[j])
-            max_joltage = max(max_joltage, joltage)
-    return max_joltage
+    # At least two columns so every bank has a candidate position
+    width = max(2, max(len(bank) for bank in banks))
+    padded = b''.join(bank.ljust(width, PADDING) for bank in banks)
+    cells = np.frombuffer(padded, dtype=np.uint8).reshape(len(banks), width)
+
+    max_right = np.maximum.accumulate(cells[:, ::-1], axis=1)[:, ::-1]
+
+    digits = cells[:, :-1].astype(np.int32) - ZERO
+    best_after = max_right[:, 1:].astype(np.int32) - ZERO
+    candidates = digits * 10 + best_after
+
+    # Padding never forms a joltage, nor does a digit with none after it
+    valid = (digits >= 0) & (best_after >= 0)
+    return np.where(valid, candidates, 0).max(axis=1)
 
 
 def find_max_joltage_k_batteries(bank, k):
@@ -44,7 +61,7 @@ def find_max_joltage_k_batteries(bank, k):
     - Move past the chosen digit and repeat
 
     Args:
-        bank: String of digits representing battery joltage ratings
+        bank: Bytes of ASCII digits representing battery joltage ratings
         k: Number of batteries to select
 
     Returns:
@@ -54,7 +71,7 @@ def find_max_joltage_k_batteries(bank, k):
     if k > n:
         return 0
 
-    result = []
+    result = bytearray()
     start = 0
 
     for i in range(k):
@@ -71,7 +88,7 @@ def find_max_joltage_k_batteries(bank, k):
         result.append(max_digit)
         start = max_index + 1
 
-    return int(''.join(result))
+    return int(result)
 
 
 def part1(data):
@@ -84,11 +101,8 @@ def part1(data):
     Returns:
         Sum of maximum joltages from all banks
     """
-    lines = data.strip().split('\n')
-    total = 0
-    for line in lines:
-        total += find_max_joltage(line)
-    return total
+    lines = data.strip().encode().split(b'\n')
+    return int(find_max_joltages(lines).sum())
 
 
 def part2(data):
@@ -101,7 +115,7 @@ def part2(data):
     Returns:
         Sum of maximum 12-digit joltages from all banks
     """
-    lines = data.strip().split('\n')
+    lines = data.strip().encode().split(b'\n')
     total = 0
     for line in lines:
         total += find_max_joltage_k_batteries(line, 12)
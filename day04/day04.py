@@ -5,40 +5,54 @@ Advent of Code 2025 - Day 04: Printing Department
 Determine which rolls of paper can be accessed by forklifts based on
 the number of adjacent rolls.
 """
+import numpy as np
 
-def count_adjacent_rolls(grid, row, col):
+# Row and column offsets of the 8 adjacent positions
+NEIGHBOUR_ROWS = np.array([-1, -1, -1, 0, 0, 1, 1, 1])
+NEIGHBOUR_COLS = np.array([-1, 0, 1, -1, 1, -1, 0, 1])
+
+
+def parse_grid(data):
     """
-    Count the number of rolls (@) adjacent to the given position.
+    Parse the grid into a mask of roll positions.
 
     Args:
-        grid: 2D list/grid of characters
-        row: Row index
-        col: Column index
+        data: Input data as string
 
     Returns:
-        Number of '@' symbols in the 8 adjacent positions
+        2D uint8 array with 1 where the grid has a roll (@) and 0 elsewhere
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    count = 0
+    lines = data.split('\n')
+    cols = len(lines[0])
+    # Every row is followed by a newline, giving rows of cols + 1 bytes
+    raw = np.frombuffer((data + '\n').encode(), dtype=np.uint8)
+    grid = raw.reshape(len(lines), cols + 1)[:, :cols]
+    return (grid == ord('@')).astype(np.uint8)
+
 
-    # Define the 8 adjacent directions
-    directions = [
-        (-1, -1), (-1, 0), (-1, 1),  # Top-left, top, top-right
-        (0, -1),           (0, 1),   # Left, right
-        (1, -1),  (1, 0),  (1, 1)    # Bottom-left, bottom, bottom-right
-    ]
+def count_adjacent_rolls(mask):
+    """
+    Count the number of rolls adjacent to every position.
 
-    for dr, dc in directions:
-        new_row = row + dr
-        new_col = col + dc
+    Args:
+        mask: 2D uint8 array with 1 where there is a roll
 
-        # Check if the position is within bounds
-        if 0 <= new_row < rows and 0 <= new_col < cols:
-            if grid[new_row][new_col] == '@':
-                count += 1
+    Returns:
+        2D array holding the number of rolls in the 8 adjacent positions
+    """
+    # The 3x3 sum is separable: add each cell's left and right neighbours,
+    # then add the rows above and below; positions outside the grid count
+    # as empty
+    row_sums = mask.copy()
+    row_sums[:, 1:] += mask[:, :-1]
+    row_sums[:, :-1] += mask[:, 1:]
+
+    totals = row_sums.copy()
+    totals[1:] += row_sums[:-1]
+    totals[:-1] += row_sums[1:]
+
+    return totals - mask
 
-    return count
 
 def part1(data):
     """
@@ -51,24 +65,10 @@ def part1(data):
     Returns:
         Number of accessible rolls
     """
-    # Parse the grid
-    grid = data.split('\n')
-
-    accessible_count = 0
-
-    # Iterate through each position in the grid
-    for row_idx, row in enumerate(grid):
-        for col_idx, cell in enumerate(row):
-            # Check if this position has a roll
-            if cell == '@':
-                # Count adjacent rolls
-                adjacent = count_adjacent_rolls(grid, row_idx, col_idx)
+    mask = parse_grid(data)
+    accessible = (mask == 1) & (count_adjacent_rolls(mask) < 4)
+    return int(accessible.sum())
 
-                # A roll is accessible if it has fewer than 4 adjacent rolls
-                if adjacent < 4:
-                    accessible_count += 1
-
-    return accessible_count
 
 def part2(data):
     """
@@ -82,35 +82,35 @@ def part2(data):
     Returns:
         Total number of rolls that can be removed
     """
-    # Parse the grid into a mutable list of lists
-    grid = [list(row) for row in data.split('\n')]
+    mask = parse_grid(data)
+    rows, cols = mask.shape
+    neighbours = count_adjacent_rolls(mask).astype(np.int8)
 
     total_removed = 0
 
     while True:
         # Find all accessible rolls in this iteration
-        accessible_positions = []
-
-        for row_idx, row in enumerate(grid):
-            for col_idx, cell in enumerate(row):
-                if cell == '@':
-                    adjacent = count_adjacent_rolls(grid, row_idx, col_idx)
-                    if adjacent < 4:
-                        accessible_positions.append((row_idx, col_idx))
+        row_idx, col_idx = np.nonzero((mask == 1) & (neighbours < 4))
 
         # If no rolls are accessible, we're done
-        if not accessible_positions:
+        if row_idx.size == 0:
             break
 
         # Remove all accessible rolls
-        for row_idx, col_idx in accessible_positions:
-            grid[row_idx][col_idx] = '.'
+        mask[row_idx, col_idx] = 0
+        total_removed += row_idx.size
 
-        # Add to total count
-        total_removed += len(accessible_positions)
+        # Only the neighbours of removed rolls change, so decrement their
+        # counts in one scatter instead of recounting the whole grid
+        adj_rows = (row_idx[:, None] + NEIGHBOUR_ROWS).ravel()
+        adj_cols = (col_idx[:, None] + NEIGHBOUR_COLS).ravel()
+        inside = ((adj_rows >= 0) & (adj_rows < rows) &
+                  (adj_cols >= 0) & (adj_cols < cols))
+        np.add.at(neighbours, (adj_rows[inside], adj_cols[inside]), -1)
 
     return total_removed
 
+
 if __name__ == "__main__":
     with open('day04.dat', 'r', encoding='utf-8') as f:
         input_data = f.read().strip()
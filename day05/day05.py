@@ -5,68 +5,115 @@ Advent of Code 2025 - Day 05: Cafeteria
 Determine which ingredient IDs are fresh based on range definitions.
 An ingredient ID is fresh if it falls within any of the provided ranges.
 """
-from typing import List, Tuple
+import bisect
+from typing import List, Tuple, Union
 
+import numpy as np
 
-def parse_input(data: str) -> Tuple[List[Tuple[int, int]], List[int]]:
+
+def split_sections(data: Union[str, bytes]) -> List[bytes]:
+    """
+    Split the input into its blank-line separated sections.
+
+    Args:
+        data: Input data as bytes (a string is encoded first)
+
+    Returns:
+        List of sections as bytes
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    # Binary reads keep Windows line endings, hiding the blank line
+    return data.replace(b'\r\n', b'\n').strip().split(b'\n\n')
+
+
+def parse_ranges(section: bytes) -> List[Tuple[int, int]]:
+    """
+    Parse the fresh ranges section of the input.
+
+    Args:
+        section: Lines of the form b"start-end"
+
+    Returns:
+        List of (start, end) tuples for fresh ingredient ranges
+    """
+    # Turning every dash into a separator lets NumPy parse all bounds in C
+    bounds = np.fromstring(section.replace(b'-', b'\n'), dtype=np.int64, sep='\n')
+    return list(map(tuple, bounds.reshape(-1, 2).tolist()))
+
+
+def parse_input(data: Union[str, bytes]) -> Tuple[List[Tuple[int, int]], List[int]]:
     """
     Parse input into fresh ranges and available ingredient IDs.
 
     Args:
-        data: Input data as string with ranges and IDs separated by blank line
+        data: Input data as bytes with ranges and IDs separated by blank line
 
     Returns:
         Tuple of (fresh_ranges, ingredient_ids) where:
         - fresh_ranges: List of (start, end) tuples for fresh ingredient ranges
         - ingredient_ids: List of available ingredient IDs to check
     """
-    sections = data.strip().split('\n\n')
+    sections = split_sections(data)
 
     # Parse fresh ranges (format: "start-end")
-    range_lines = sections[0].strip().split('\n')
-    fresh_ranges = []
-    for line in range_lines:
-        start, end = line.split('-')
-        fresh_ranges.append((int(start), int(end)))
+    fresh_ranges = parse_ranges(sections[0])
 
     # Parse available ingredient IDs
-    id_lines = sections[1].strip().split('\n')
-    ingredient_ids = [int(line) for line in id_lines]
+    ingredient_ids = np.fromstring(sections[1], dtype=np.int64, sep='\n').tolist()
 
     return fresh_ranges, ingredient_ids
 
 
-def is_fresh(ingredient_id: int, ranges: List[Tuple[int, int]]) -> bool:
+def range_bounds(ranges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Flatten ranges into a sorted list of boundaries for binary search.
+
+    Args:
+        ranges: List of (start, end) tuples for fresh ingredient ranges
+
+    Returns:
+        Sorted list [start0, end0 + 1, start1, end1 + 1, ...] of the merged
+        ranges, where each pair is a half-open interval
+    """
+    starts, ends = merge_ranges(ranges)
+    return np.column_stack((starts, ends + 1)).ravel().tolist()
+
+
+def is_fresh(ingredient_id: int, bounds: List[int]) -> bool:
     """
-    Check if an ingredient ID is fresh based on provided ranges.
+    Check if an ingredient ID is fresh based on provided range boundaries.
 
     Args:
         ingredient_id: The ingredient ID to check
-        ranges: List of (start, end) tuples representing fresh ingredient ranges
+        bounds: Sorted range boundaries as returned by range_bounds
 
     Returns:
         True if ingredient ID falls within any range (inclusive), False otherwise
     """
-    return any(start <= ingredient_id <= end for start, end in ranges)
+    # An odd number of boundaries at or below the ID means it lies between
+    # a range start and that range's exclusive end
+    return bisect.bisect_right(bounds, ingredient_id) % 2 == 1
 
 
-def part1(data: str) -> int:
+def part1(data: Union[str, bytes]) -> int:
     """
     Count how many available ingredient IDs are fresh.
 
     Args:
-        data: Input data as string
+        data: Input data as bytes (or string)
 
     Returns:
         Number of fresh ingredient IDs
     """
     fresh_ranges, ingredient_ids = parse_input(data)
+    bounds = range_bounds(fresh_ranges)
     fresh_count = sum(1 for ingredient_id in ingredient_ids
-                      if is_fresh(ingredient_id, fresh_ranges))
+                      if is_fresh(ingredient_id, bounds))
     return fresh_count
 
 
-def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+def merge_ranges(ranges: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
     """
     Merge overlapping ranges into non-overlapping ranges.
 
@@ -74,60 +121,50 @@ def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         ranges: List of (start, end) tuples
 
     Returns:
-        List of merged (start, end) tuples with no overlaps
+        Tuple of (starts, ends) arrays of the merged ranges, sorted by start
+        and with no overlaps
     """
-    if not ranges:
-        return []
+    bounds = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+    if bounds.size == 0:
+        return bounds[:, 0], bounds[:, 1]
 
     # Sort ranges by start position
-    sorted_ranges = sorted(ranges)
-    merged = [sorted_ranges[0]]
+    order = np.argsort(bounds[:, 0], kind='stable')
+    starts = bounds[order, 0]
+    ends = bounds[order, 1]
 
-    for start, end in sorted_ranges[1:]:
-        last_start, last_end = merged[-1]
+    # A range opens a new merged range unless it overlaps or is adjacent to
+    # the furthest end reached by the ranges before it
+    running_end = np.maximum.accumulate(ends)
+    opens_group = np.concatenate(([True], starts[1:] > running_end[:-1] + 1))
+    group_starts = np.flatnonzero(opens_group)
 
-        # Check if current range overlaps or is adjacent to the last merged range
-        if start <= last_end + 1:
-            # Merge by extending the end of the last range
-            merged[-1] = (last_start, max(last_end, end))
-        else:
-            # No overlap, add as new range
-            merged.append((start, end))
+    return starts[group_starts], np.maximum.reduceat(ends, group_starts)
 
-    return merged
 
-
-def part2(data: str) -> int:
+def part2(data: Union[str, bytes]) -> int:
     """
     Count total number of unique ingredient IDs covered by all ranges.
 
     Args:
-        data: Input data as string
+        data: Input data as bytes (or string)
 
     Returns:
         Total count of unique ingredient IDs in all ranges
     """
     # Parse only the ranges section (ignore available IDs if present)
-    sections = data.strip().split('\n\n')
-    range_lines = sections[0].strip().split('\n')
-
-    # Parse ranges
-    ranges = []
-    for line in range_lines:
-        start, end = line.split('-')
-        ranges.append((int(start), int(end)))
+    sections = split_sections(data)
+    ranges = parse_ranges(sections[0])
 
     # Merge overlapping ranges
-    merged_ranges = merge_ranges(ranges)
+    starts, ends = merge_ranges(ranges)
 
     # Count total IDs in merged ranges
-    total_count = sum(end - start + 1 for start, end in merged_ranges)
-
-    return total_count
+    return int((ends - starts + 1).sum())
 
 
 if __name__ == "__main__":
-    with open('day05.dat', 'r', encoding='utf-8') as f:
+    with open('day05.dat', 'rb') as f:
         input_data = f.read().strip()
 
     print(f"Part 1: {part1(input_data)}")
@@ -6,83 +6,144 @@ Parse and calculate results from a math worksheet where problems are arranged
 in vertical columns. Each column contains numbers in the first 4 rows and an
 operator (* or +) in the last row.
 """
+import math
 from typing import List, Tuple
 
+import numpy as np
 
-def find_column_boundaries(lines: List[str]) -> List[Tuple[int, int]]:
+SPACE = ord(' ')
+ZERO = ord('0')
+NINE = ord('9')
+
+# Powers of ten up to the largest that fits in an int64
+POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+def build_grid(lines: List[str]) -> np.ndarray:
     """
-    Find column boundaries by identifying contiguous regions with content.
+    Stack the worksheet rows into a 2D array of character codes.
 
     Args:
         lines: List of strings representing all rows of the worksheet
 
     Returns:
-        List of (start, end) tuples representing column boundaries
+        2D uint8 array with one row per line, padded with spaces to the
+        length of the longest line
     """
-    # Find maximum line length
     max_len = max(len(line) for line in lines)
+    padded = ''.join(line.ljust(max_len) for line in lines)
+    return np.frombuffer(padded.encode(), dtype=np.uint8).reshape(len(lines), max_len)
 
-    # Create boolean array marking positions where ANY row has content
-    has_content = [False] * max_len
 
-    for line in lines:
-        for i, char in enumerate(line):
-            if char != ' ':
-                has_content[i] = True
+def find_column_boundaries(grid: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Find column boundaries by identifying contiguous regions with content.
 
-    # Find contiguous regions of True values
-    columns = []
-    in_column = False
-    start = 0
+    Args:
+        grid: 2D array of character codes as returned by build_grid
 
-    for i, has_char in enumerate(has_content):
-        if has_char and not in_column:
-            in_column = True
-            start = i
-        elif not has_char and in_column:
-            in_column = False
-            columns.append((start, i))
+    Returns:
+        List of (start, end) tuples representing column boundaries
+    """
+    # Mark positions where ANY row has content
+    has_content = (grid != SPACE).any(axis=0)
 
-    # Handle last column if it extends to end
-    if in_column:
-        columns.append((start, len(has_content)))
+    # Contiguous regions start where content switches on and end where it
+    # switches off; padding with empty columns closes regions at the edges
+    edges = np.diff(has_content.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
 
-    return columns
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
-def calculate_column_result(lines: List[str], start: int, end: int) -> int:
+def read_operators(grid: np.ndarray, columns: List[Tuple[int, int]]) -> List[str]:
     """
-    Calculate the result for a single column.
+    Read the operator of every problem from the last row.
 
     Args:
-        lines: List of strings representing all rows
-        start: Start index of column
-        end: End index of column (exclusive)
+        grid: 2D array of character codes as returned by build_grid
+        columns: List of (start, end) problem boundaries
 
     Returns:
-        Result of the calculation for this column
+        List of operators, one per problem
     """
-    # Get operator from last row
-    operator = lines[-1][start:end].strip()
+    operator_row = grid[-1].tobytes().decode()
+    return [operator_row[start:end].strip() for start, end in columns]
+
 
-    # Get numbers from all rows except last
-    numbers = []
-    for row_idx in range(len(lines) - 1):
-        text = lines[row_idx][start:end].strip()
-        if text:
-            numbers.append(int(text))
+def digit_values(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert every character of the number rows to its digit value at once.
+
+    Args:
+        rows: 2D array of character codes of the number rows
+
+    Returns:
+        Tuple of (is_digit mask, digit values with 0 for non-digits)
+    """
+    is_digit = (rows >= ZERO) & (rows <= NINE)
+    digits = np.where(is_digit, rows - ZERO, 0).astype(np.int64)
+    return is_digit, digits
+
+
+def apply_operator(operator: str, numbers: List[int]) -> int:
+    """
+    Combine the numbers of a problem with its operator.
+
+    Args:
+        operator: '+' or '*'
+        numbers: Numbers of the problem
 
-    # Calculate based on operator
+    Returns:
+        Sum or product of the numbers, or 0 for an unknown operator
+    """
     if operator == '+':
         return sum(numbers)
     if operator == '*':
-        result = 1
-        for num in numbers:
-            result *= num
-        return result
+        return math.prod(numbers)
     return 0
 
 
+def read_row_numbers(grid: np.ndarray, columns: List[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Read the numbers of every problem, one number per row.
+
+    All problems are parsed together: each digit is weighted by the power of
+    ten given by the number of digits after it in the same row and problem,
+    then the weighted digits are summed per problem.
+
+    Args:
+        grid: 2D array of character codes as returned by build_grid
+        columns: List of (start, end) problem boundaries
+
+    Returns:
+        List holding the numbers of each problem, top to bottom
+    """
+    is_digit, digits = digit_values(grid[:-1])
+    starts = np.array([start for start, _ in columns])
+    ends = np.array([end for _, end in columns])
+
+    # Digits at or after each position in its row, counted from the right
+    remaining = np.cumsum(is_digit[:, ::-1], axis=1)[:, ::-1]
+    # The same count just past each problem, to discount later problems
+    remaining_past_end = np.pad(remaining, ((0, 0), (0, 1)))[:, ends]
+    problem_of_col = np.maximum(np.searchsorted(starts, np.arange(grid.shape[1]),
+                                                side='right') - 1, 0)
+
+    places = remaining - is_digit - remaining_past_end[:, problem_of_col]
+    weighted = digits * POW10[np.where(is_digit, places, 0)]
+
+    # Summing from each problem's start up to the next one only adds zeros
+    # from the blank separator columns
+    values = np.add.reduceat(weighted, starts, axis=1).T.tolist()
+    present = np.logical_or.reduceat(is_digit, starts, axis=1).T.tolist()
+
+    return [[value for value, has_number in zip(problem_values, problem_present)
+             if has_number]
+            for problem_values, problem_present in zip(values, present)]
+
+
 def part1(data: str) -> int:
     """
     Calculate the grand total from the math worksheet.
@@ -93,62 +154,45 @@ def part1(data: str) -> int:
     Returns:
         Grand total of all column calculations
     """
-    lines = data.strip().split('\n')
-    columns = find_column_boundaries(lines)
+    grid = build_grid(data.strip().split('\n'))
+    columns = find_column_boundaries(grid)
 
-    grand_total = 0
-    for start, end in columns:
-        grand_total += calculate_column_result(lines, start, end)
+    operators = read_operators(grid, columns)
+    numbers = read_row_numbers(grid, columns)
 
-    return grand_total
+    return sum(apply_operator(operator, problem_numbers)
+               for operator, problem_numbers in zip(operators, numbers))
 
 
-def calculate_column_result_cephalopod(lines: List[str], start: int, end: int) -> int:
+def read_column_numbers(grid: np.ndarray, columns: List[Tuple[int, int]]) -> List[List[int]]:
     """
-    Calculate the result for a single column using cephalopod math (right-to-left).
+    Read the numbers of every problem using cephalopod math (right-to-left).
 
     In cephalopod math, each character column within a problem represents a separate
     number, read top-to-bottom (most to least significant digit), and we process
     columns right-to-left.
 
+    Every character column of the worksheet is built at once with Horner's
+    rule, stepping down the few number rows and only shifting in a digit
+    where the row has one.
+
     Args:
-        lines: List of strings representing all rows
-        start: Start index of problem region
-        end: End index of problem region (exclusive)
+        grid: 2D array of character codes as returned by build_grid
+        columns: List of (start, end) problem boundaries
 
     Returns:
-        Result of the calculation for this problem
-    """
-    # Get operator from last row
-    operator = lines[-1][start:end].strip()
-
-    # Collect numbers by reading each column position right-to-left
-    numbers = []
-
-    # Process each column position from right to left
-    for col_pos in range(end - 1, start - 1, -1):
-        # Extract digits from this column (all rows except operator row)
-        digits = []
-        for row_idx in range(len(lines) - 1):
-            if col_pos < len(lines[row_idx]):
-                char = lines[row_idx][col_pos]
-                if char.isdigit():
-                    digits.append(char)
-
-        # Form number from digits (top to bottom = most to least significant)
-        if digits:
-            number = int(''.join(digits))
-            numbers.append(number)
-
-    # Calculate based on operator
-    if operator == '+':
-        return sum(numbers)
-    if operator == '*':
-        result = 1
-        for num in numbers:
-            result *= num
-        return result
-    return 0
+        List holding the numbers of each problem, right to left
+    """
+    is_digit, digits = digit_values(grid[:-1])
+
+    values = np.zeros(grid.shape[1], dtype=np.int64)
+    for row_is_digit, row_digits in zip(is_digit, digits):
+        values = np.where(row_is_digit, values * 10 + row_digits, values)
+    values = np.where(is_digit.any(axis=0), values, -1).tolist()
+
+    # Columns without any digit are marked -1 and skipped
+    return [[value for value in reversed(values[start:end]) if value >= 0]
+            for start, end in columns]
 
 
 def part2(data: str) -> int:
@@ -161,14 +205,14 @@ def part2(data: str) -> int:
     Returns:
         Grand total of all column calculations using cephalopod math
     """
-    lines = data.strip().split('\n')
-    columns = find_column_boundaries(lines)
+    grid = build_grid(data.strip().split('\n'))
+    columns = find_column_boundaries(grid)
 
-    grand_total = 0
-    for start, end in columns:
-        grand_total += calculate_column_result_cephalopod(lines, start, end)
+    operators = read_operators(grid, columns)
+    numbers = read_column_numbers(grid, columns)
 
-    return grand_total
+    return sum(apply_operator(operator, problem_numbers)
+               for operator, problem_numbers in zip(operators, numbers))
 
 
 if __name__ == "__main__":
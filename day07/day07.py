@@ -7,7 +7,12 @@ moving downward. When a beam encounters a splitter (^), it stops and emits two
 new beams from the left and right positions. Count total splits.
 """
 from typing import List, Tuple
-from collections import deque
+
+import numpy as np
+
+# Each row at most doubles the largest timeline count, so counts below
+# this bound can advance another row without overflowing int64
+INT64_SAFE_COUNT = 2 ** 62
 
 
 def parse_grid(data: str) -> Tuple[List[str], Tuple[int, int]]:
@@ -32,68 +37,81 @@ def parse_grid(data: str) -> Tuple[List[str], Tuple[int, int]]:
     raise ValueError("Starting position 'S' not found in grid")
 
 
-def simulate_beam_splitting(grid: List[str], start_pos: Tuple[int, int]) -> int:
+def grid_cells(grid: List[str]) -> np.ndarray:
     """
-    Simulate tachyon beam splitting through the manifold.
+    View the grid as a 2D array of cell bytes.
 
     Args:
         grid: List of strings representing the grid
-        start_pos: Starting position (row, col) of initial beam
 
     Returns:
-        Total number of unique splitters activated
+        2D uint8 array with one ASCII byte per cell
     """
     rows = len(grid)
     cols = len(grid[0]) if rows > 0 else 0
+    return np.frombuffer(''.join(grid).encode(), dtype=np.uint8).reshape(rows, cols)
 
-    queue = deque([start_pos])
-    activated_splitters = set()
-    visited = set([start_pos])  # Track visited positions to avoid reprocessing
 
-    while queue:
-        row, col = queue.popleft()
+def row_bitsets(cells: np.ndarray, marks: bytes) -> List[int]:
+    """
+    Pack the columns of each row holding certain cells into a bitset.
 
-        # Move beam down one row
-        new_row = row + 1
+    Every cell not listed in marks maps to a clear bit.
 
-        # Check if beam exits grid
-        if new_row >= rows:
-            continue
+    Args:
+        cells: 2D uint8 array of grid cells
+        marks: Cell characters whose columns get a set bit
 
-        # Check column bounds
-        if col < 0 or col >= cols:
-            continue
+    Returns:
+        List with, for each row, an integer with bit c set when column c of
+        the row holds one of the marks
+    """
+    mask = np.isin(cells, np.frombuffer(marks, dtype=np.uint8))
+    # Little-endian bit order puts column 0 in the least significant bit
+    packed = np.packbits(mask, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
 
-        # Skip if we've already processed this position
-        if (new_row, col) in visited:
-            continue
 
-        visited.add((new_row, col))
+def simulate_beam_splitting(grid: List[str], start_pos: Tuple[int, int]) -> int:
+    """
+    Simulate tachyon beam splitting through the manifold.
 
-        # Get cell at new position
-        cell = grid[new_row][col]
+    All beams in a row are tracked together as a bitset of their columns,
+    so each row is advanced with a handful of bitwise operations. Beams
+    merging into the same column collapse into a single bit, just as they
+    would share one visited position.
 
-        if cell in ('.', 'S'):
-            # Beam continues downward
-            queue.append((new_row, col))
-        elif cell == '^':
-            # Record this splitter as activated
-            activated_splitters.add((new_row, col))
+    Args:
+        grid: List of strings representing the grid
+        start_pos: Starting position (row, col) of initial beam
 
-            # Create two new beams at left and right positions
-            # New beams start at same row as splitter
-            left_col = col - 1
-            right_col = col + 1
+    Returns:
+        Total number of unique splitters activated
+    """
+    cells = grid_cells(grid)
+    rows, cols = cells.shape
+    full = (1 << cols) - 1
+    # Unknown cells are in neither bitset, so beams entering them stop
+    splitters = row_bitsets(cells, b'^')
+    open_cells = row_bitsets(cells, b'.S')
+
+    start_row, start_col = start_pos
+    beams = 1 << start_col
+    activated = 0
+
+    for row in range(start_row + 1, rows):
+        if not beams:
+            break
 
-            # Enqueue left beam if in bounds
-            if 0 <= left_col < cols:
-                queue.append((new_row, left_col))
+        # Beams entering splitters stop there; beams on open cells continue
+        split = beams & splitters[row]
+        activated += split.bit_count()
 
-            # Enqueue right beam if in bounds
-            if 0 <= right_col < cols:
-                queue.append((new_row, right_col))
+        # Each splitter emits two new beams from its left and right
+        beams = ((beams & open_cells[row]) |
+                 ((split << 1) & full) | (split >> 1))
 
-    return len(activated_splitters)
+    return activated
 
 
 def count_timelines(grid: List[str], start_pos: Tuple[int, int]) -> int:
@@ -104,6 +122,13 @@ def count_timelines(grid: List[str], start_pos: Tuple[int, int]) -> int:
     creating separate timelines via many-worlds interpretation. This function
     counts all possible paths from start to exit.
 
+    The timeline counts are filled in bottom-up, one row at a time: a
+    particle on an open cell continues along the count of the row below,
+    a splitter adds the counts to its left and right, and leaving the grid
+    (or reaching an unknown cell) ends a single timeline. Counts can double
+    with every row of splitters, so once they could overflow int64 the rows
+    switch to Python integers, still one vector operation per row.
+
     Args:
         grid: List of strings representing the grid
         start_pos: Starting position (row, col) of initial particle
@@ -111,55 +136,30 @@ def count_timelines(grid: List[str], start_pos: Tuple[int, int]) -> int:
     Returns:
         Total number of distinct timelines
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
-    memo = {}
-
-    def explore(row: int, col: int) -> int:
-        """
-        Count timelines from this position.
-
-        Args:
-            row: Current row
-            col: Current column
-
-        Returns:
-            Number of timelines from this position
-        """
-        if (row, col) in memo:
-            return memo[(row, col)]
-
-        # Move down one row
-        new_row = row + 1
-
-        # Check if exited bottom
-        if new_row >= rows:
-            return 1
-
-        # Check left/right bounds
-        if col < 0 or col >= cols:
-            return 1
-
-        cell = grid[new_row][col]
-
-        if cell in ('.', 'S'):
-            # Continue downward in same timeline
-            result = explore(new_row, col)
-        elif cell == '^':
-            # Quantum split: particle takes both paths
-            # Count timelines from left + timelines from right
-            left = explore(new_row, col - 1)
-            right = explore(new_row, col + 1)
-            result = left + right
-        else:
-            # Unknown cell, treat as exit
-            result = 1
-
-        memo[(row, col)] = result
-        return result
-
-    return explore(start_pos[0], start_pos[1])
+    cells = grid_cells(grid)
+    rows, cols = cells.shape
+    is_open = (cells == ord('.')) | (cells == ord('S'))
+    is_splitter = cells == ord('^')
+
+    start_row, start_col = start_pos
+
+    # Timelines from each column just before moving into the next row;
+    # moving down from the last row always exits the grid
+    timelines = np.ones(cols, dtype=np.int64)
+    # Columns beyond either edge exit the grid as a single timeline
+    padded = np.ones(cols + 2, dtype=np.int64)
+
+    for row in range(rows - 1, start_row, -1):
+        if padded.dtype != object and np.max(timelines, initial=0) >= INT64_SAFE_COUNT:
+            timelines = timelines.astype(object)
+            padded = padded.astype(object)
+
+        padded[1:-1] = timelines
+        split = padded[:-2] + padded[2:]
+        timelines = np.where(is_open[row], timelines,
+                             np.where(is_splitter[row], split, 1))
+
+    return int(timelines[start_col])
 
 
 def part1(data: str) -> int:
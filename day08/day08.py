@@ -6,13 +6,30 @@ Connect junction boxes in 3D space using Union-Find algorithm.
 Find the product of the three largest circuit sizes after making
 the 1000 shortest connections.
 """
+import heapq
+from array import array
+
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+
+# Number of closest pairs connected in part 1
+CONNECTIONS = 1000
+
+# Rows of squared distances computed at once in part 1
+BLOCK_ROWS = 256
+
+# Neighbours per box first tried in part 2, doubled until sufficient
+NEAREST_NEIGHBOURS = 32
 
 
 class DisjointSet:
     """
     Union-Find data structure for tracking circuits.
 
-    Uses path compression and union by rank for optimal performance.
+    Uses path compression and union by size, with parent and size packed
+    into one compact C int array: a non-negative entry is the element's
+    parent, while a root holds minus the size of its set.
     """
 
     def __init__(self, n: int):
@@ -22,23 +39,31 @@ class DisjointSet:
         Args:
             n: Number of initial elements
         """
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.size = [1] * n
+        self.parent = array('i', [-1]) * n
 
     def find(self, x: int) -> int:
         """
         Find the root of x with path compression.
 
+        Walks up to the root, then points every element on the path
+        directly at it, without recursion.
+
         Args:
             x: Element to find root for
 
         Returns:
             Root of the set containing x
         """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+
+        root = x
+        while parent[root] >= 0:
+            root = parent[root]
+
+        while x != root:
+            parent[x], x = root, parent[x]
+
+        return root
 
     def union(self, x: int, y: int) -> bool:
         """
@@ -51,53 +76,206 @@ class DisjointSet:
         Returns:
             True if connection created, False if already connected
         """
-        root_x = self.find(x)
-        root_y = self.find(y)
+        find = self.find
+        root_x = find(x)
+        root_y = find(y)
 
         if root_x == root_y:
             return False  # Already connected
 
-        # Union by rank
-        if self.rank[root_x] < self.rank[root_y]:
+        # Union by size, roots storing their negated sizes
+        parent = self.parent
+        if parent[root_x] > parent[root_y]:
             root_x, root_y = root_y, root_x
 
-        self.parent[root_y] = root_x
-        self.size[root_x] += self.size[root_y]
-
-        if self.rank[root_x] == self.rank[root_y]:
-            self.rank[root_x] += 1
+        parent[root_x] += parent[root_y]
+        parent[root_y] = root_x
 
         return True
 
 
-def parse_coordinates(data: str) -> list[tuple[int, int, int]]:
+def parse_coordinates(data: str) -> np.ndarray:
     """
-    Parse input data into list of 3D coordinates.
+    Parse input data into an array of 3D coordinates.
 
     Args:
         data: Raw input data with coordinates
 
     Returns:
-        List of (x, y, z) coordinates
+        (n, 3) integer array with one (x, y, z) row per box
+    """
+    # Treat commas as line breaks so numpy's C parser reads every value
+    values = np.fromstring(data.replace(',', '\n'), dtype=np.int64, sep='\n')
+    return values.reshape(-1, 3)
+
+
+def closest_indices(dist_sq: np.ndarray, count: int) -> np.ndarray:
+    """
+    Find the entries no further than the count-th smallest distance.
+
+    Selects with np.partition instead of a full sort. Entries
+    tied with the count-th smallest are all kept, so ties can still be
+    broken by position afterwards.
+
+    Args:
+        dist_sq: Array of squared distances
+        count: Number of smallest distances wanted
+
+    Returns:
+        Indices of the kept entries, in ascending order
+    """
+    if dist_sq.size <= count:
+        return np.arange(dist_sq.size)
+    cutoff = np.partition(dist_sq, count - 1)[count - 1]
+    return np.flatnonzero(dist_sq <= cutoff)
+
+
+def closest_in_block(block: np.ndarray, count: int
+                     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pick out the closest pairs in a block of squared distances.
+
+    Anything further than the block's count-th closest pair can not be
+    among the closest overall, so only those within it are kept.
+
+    Args:
+        block: Squared distances, with cells that are not pairs set to inf
+        count: Number of closest pairs wanted
+
+    Returns:
+        Tuple of (squared distances, rows, columns) of the kept cells, in
+        row-major order
+    """
+    dist_sq = block.reshape(-1)
+    keep = closest_indices(dist_sq, count)
+    keep = keep[dist_sq[keep] < np.inf]  # Small blocks keep masked cells
+
+    # Flat positions are row-major, so turn them back into (row, column)
+    rows, cols = np.divmod(keep, block.shape[1])
+    return dist_sq[keep], rows, cols
+
+
+def shortest_pairs(points: np.ndarray, count: int
+                   ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    List the count closest pairs of points, from closest to furthest.
+
+    Squared distances are computed a block of rows at a time into one
+    reused buffer, so each block stays cache sized. Only the block's
+    closest pairs are kept, without building index arrays for all pairs.
+    Squared distances sort exactly like distances, so no square root is
+    taken. cdist works in float64, but with integer coordinates less than
+    50,000,000 apart every step of the sum is an integer below 2^53, so the
+    results are exact integers and ties compare equal.
+
+    Args:
+        points: (n, 3) integer array of coordinates
+        count: Number of pairs to return
+
+    Returns:
+        Tuple of (first indices, second indices) of the closest pairs,
+        ties broken by index as a sort of (dist, i, j) would
     """
-    return [tuple(map(int, line.split(','))) for line in data.splitlines()]
+    n = len(points)
+    dists, firsts, seconds = [], [], []
+
+    # One buffer and diagonal mask serve every block, with column 0 of a
+    # block lying on its first row's diagonal
+    buffer = np.empty(min(BLOCK_ROWS, n) * n)
+    on_or_below_diagonal = np.tri(BLOCK_ROWS, dtype=bool)
+
+    for start in range(0, n, BLOCK_ROWS):
+        rows = min(BLOCK_ROWS, n - start)
+        # Pairs i < j of these rows only use columns from start onwards
+        block = buffer[:rows * (n - start)].reshape(rows, n - start)
+        cdist(points[start:start + rows], points[start:], 'sqeuclidean',
+              out=block)
+        block[:, :rows][on_or_below_diagonal[:rows, :rows]] = np.inf
+
+        dist_sq, first, second = closest_in_block(block, count)
+        dists.append(dist_sq)
+        firsts.append(first + start)
+        seconds.append(second + start)
+
+    dist_sq = np.concatenate(dists)
+    # Only sort the closest survivors; blocks are in row-major order, so
+    # a stable sort breaks ties by index
+    order = closest_indices(dist_sq, count)
+    order = order[np.argsort(dist_sq[order], kind='stable')[:count]]
+    return np.concatenate(firsts)[order], np.concatenate(seconds)[order]
+
+
+def nearest_neighbour_pairs(points: np.ndarray, k: int
+                            ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    List the pairs formed by each point and its k nearest neighbours.
+
+    A k-d tree finds the neighbours without materialising all n^2 pairs.
+    Any pair left out is at least as far apart as the returned bound, so
+    the candidates contain every pair shorter than it.
 
+    Args:
+        points: (n, 3) integer array of coordinates
+        k: Number of neighbours to take for each point
 
-def euclidean_distance(p1: tuple[int, int, int],
-                       p2: tuple[int, int, int]) -> float:
+    Returns:
+        Tuple of (squared distances, first indices, second indices, bound)
+        with the unique candidate pairs i < j ordered by distance (ties by
+        index), and bound the smallest squared distance a left-out pair may
+        have (infinite when every pair is included)
     """
-    Calculate Euclidean distance between two 3D points.
+    n = len(points)
+    count = min(k + 1, n)  # The nearest point to each is itself
+    _, neighbours = cKDTree(points).query(points, k=count)
+
+    rows = np.repeat(np.arange(n), count)
+    cols = neighbours.reshape(-1)
+    diff = points[rows] - points[cols]
+    dist_sq = (diff * diff).sum(axis=1)
+
+    # A point's furthest returned neighbour bounds all pairs left out for it
+    bound = dist_sq.reshape(n, count)[:, -1].min() if count < n else np.inf
+
+    # Keep each pair once, keyed in row-major (i, j) order
+    keys = np.minimum(rows, cols) * n + np.maximum(rows, cols)
+    keys, unique_idx = np.unique(keys[rows != cols], return_index=True)
+    dist_sq = dist_sq[rows != cols][unique_idx]
+
+    order = np.argsort(dist_sq, kind='stable')
+    first, second = np.divmod(keys[order], n)
+    return dist_sq[order], first, second, float(bound)
+
+
+def connect_pairs(disjoint_set: DisjointSet, first: np.ndarray,
+                  second: np.ndarray) -> tuple[int, int] | None:
+    """
+    Connect pairs of junction boxes in order until one circuit remains.
 
     Args:
-        p1: First point coordinates
-        p2: Second point coordinates
+        disjoint_set: Circuits formed so far, updated in place
+        first: First box of each pair, in connection order
+        second: Second box of each pair, in connection order
 
     Returns:
-        Euclidean distance between points
+        The pair whose connection joined the last two circuits, or None if
+        more than one circuit is left after all pairs
     """
-    return ((p1[0] - p2[0])**2 +
-            (p1[1] - p2[1])**2 +
-            (p1[2] - p2[2])**2) ** 0.5
+    union = disjoint_set.union
+    # A spanning set of connections needs exactly n - 1 successful merges
+    n = len(disjoint_set.parent)
+    merges_left = n - 1
+
+    # Only a short prefix of the pairs is usually needed, so convert them
+    # to Python ints a block at a time rather than all at once
+    for start in range(0, len(first), max(n, 1)):
+        block = zip(first[start:start + n].tolist(), second[start:start + n].tolist())
+        for x, y in block:
+            if union(x, y):
+                merges_left -= 1  # Merged two circuits into one
+                if merges_left == 0:
+                    return x, y
+
+    return None
 
 
 def part1(data: str) -> int:
@@ -113,36 +291,23 @@ def part1(data: str) -> int:
     Returns:
         Product of three largest circuit sizes
     """
-    coordinates = parse_coordinates(data)
-    n = len(coordinates)
-
-    # Compute all pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i+1, n):
-            dist = euclidean_distance(coordinates[i], coordinates[j])
-            distances.append((dist, i, j))
+    points = parse_coordinates(data)
+    n = len(points)
 
-    # Sort by distance
-    distances.sort()
+    # Find the closest pairs without sorting all of them
+    first, second = shortest_pairs(points, CONNECTIONS)
 
     # Attempt to connect 1000 closest pairs using DisjointSet
     disjoint_set = DisjointSet(n)
-    attempts = 0
+    connect_pairs(disjoint_set, first, second)
 
-    for _, x, y in distances:
-        disjoint_set.union(x, y)
-        attempts += 1
-        if attempts == 1000:
-            break
-
-    # Get circuit sizes (only count root nodes)
-    circuit_sizes = [disjoint_set.size[i] for i in range(n)
-                     if disjoint_set.find(i) == i]
-    circuit_sizes.sort(reverse=True)
+    # Only roots are negative, holding minus their circuit size, so the
+    # three most negative entries are the three largest circuits
+    roots = [entry for entry in disjoint_set.parent if entry < 0]
+    largest = heapq.nsmallest(3, roots)
 
     # Return product of three largest
-    return circuit_sizes[0] * circuit_sizes[1] * circuit_sizes[2]
+    return -largest[0] * -largest[1] * -largest[2]
 
 
 def part2(data: str) -> int:
@@ -158,32 +323,33 @@ def part2(data: str) -> int:
     Returns:
         Product of X coordinates of final connection
     """
-    coordinates = parse_coordinates(data)
-    n = len(coordinates)
-
-    # Compute all pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i+1, n):
-            dist = euclidean_distance(coordinates[i], coordinates[j])
-            distances.append((dist, i, j))
-
-    # Sort by distance
-    distances.sort()
-
-    # Connect pairs until all in one circuit
-    disjoint_set = DisjointSet(n)
-    circuits = n  # Start with n separate circuits
+    points = parse_coordinates(data)
+    n = len(points)
+
+    # Only short pairs end up connecting the circuits, so run Kruskal on
+    # each box's nearest neighbours, widening the search until the result
+    # provably matches the one over all pairs
+    k = NEAREST_NEIGHBOURS
+    while True:
+        _, first, second, bound = nearest_neighbour_pairs(points, k)
+
+        # Connect pairs until all in one circuit
+        last_pair = connect_pairs(DisjointSet(n), first, second)
+        if last_pair is not None:
+            x, y = last_pair
+            diff = points[x] - points[y]
+            if diff @ diff < bound:
+                # Every pair shorter than the last connection was a candidate
+                break
+        if k >= n - 1:
+            break
+        k *= 2
 
-    for _, x, y in distances:
-        if disjoint_set.union(x, y):
-            circuits -= 1  # Merged two circuits into one
-            if circuits == 1:
-                # All boxes now in one circuit
-                # Return product of X coordinates
-                return coordinates[x][0] * coordinates[y][0]
+    if last_pair is None:
+        return -1  # Should never reach here
 
-    return -1  # Should never reach here
+    # Return product of X coordinates
+    return int(points[x, 0]) * int(points[y, 0])
 
 
 if __name__ == "__main__":